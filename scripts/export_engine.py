@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+YOLOv8 Inference Export Script
+Version: 1.1.0
+Date: 2026-10-16
+
+Purpose: Export the trained YOLOv8 deer detection model to optimized
+inference formats:
+    engine   - TensorRT FP16 engine for NVIDIA GPUs
+    openvino - OpenVINO INT8 model for CPU-only machines
+
+WHY: Eager PyTorch pays a kernel launch per layer, which dominates yolov8n
+inference time. TensorRT fuses conv+BN+SiLU into single kernels and runs
+them in FP16 on tensor cores, typically 2-3x faster than the .pt weights.
+On CPU, OpenVINO INT8 (post-training quantization) runs about 3x faster
+than PyTorch FP32. Ultralytics YOLO() loads both formats transparently.
+
+The TensorRT engine is built for the local GPU and TensorRT version, so
+export it on the machine that will run inference (re-run after upgrades).
+INT8 calibration needs representative images: pass a dataset YAML with
+--data, or a folder of trail-cam images with --calib-dir.
+
+Usage:
+    python3 scripts/export_engine.py
+    python3 scripts/export_engine.py --model src/models/yolov8n_deer.pt --batch 16
+    python3 scripts/export_engine.py --format openvino --calib-dir /path/to/images/
+
+Output (next to the source weights):
+    src/models/yolov8n_deer.engine
+    src/models/yolov8n_deer_int8_openvino_model/
+"""
+
+import os
+import sys
+import argparse
+import shutil
+import tempfile
+from pathlib import Path
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+
+def export_engine(model_path: Path, batch: int, imgsz: int, device: str) -> Path:
+    """
+    Export YOLOv8 weights to a TensorRT FP16 engine.
+
+    Args:
+        model_path: Path to .pt weights
+        batch: Maximum batch size the engine accepts
+        imgsz: Input image size (square)
+        device: CUDA device index
+
+    Returns:
+        Path to the exported .engine file
+    """
+    from ultralytics import YOLO
+
+    print(f"[INFO] Loading model from: {model_path}")
+    model = YOLO(str(model_path))
+
+    # WHY dynamic: a static engine only accepts exactly `batch` images, so the
+    # last partial batch of a run would fail. Dynamic shapes keep batch as
+    # the optimization maximum while still accepting smaller batches.
+    print(f"[INFO] Exporting TensorRT FP16 engine (batch<={batch}, imgsz={imgsz})...")
+    print("[INFO] This takes several minutes on first build")
+    engine_path = model.export(
+        format='engine',
+        half=True,
+        imgsz=imgsz,
+        batch=batch,
+        dynamic=True,
+        device=device
+    )
+
+    return Path(engine_path)
+
+
+def write_calibration_yaml(calib_dir: Path, names: dict, num_images: int,
+                           output_dir: Path) -> Path:
+    """
+    Write a minimal dataset YAML pointing at a folder of calibration images.
+
+    WHY: Ultralytics INT8 export reads calibration images through a dataset
+    YAML. Labels are not needed for calibration, only representative inputs.
+    The images are linked into output_dir/images/ because Ultralytics derives
+    label paths (and writes its label .cache) next to the images folder; this
+    keeps every derived file inside output_dir instead of the photo library.
+
+    Args:
+        calib_dir: Folder of representative images
+        names: Model class names (id -> name)
+        num_images: Number of images to calibrate on
+        output_dir: Directory for the linked images, image list and YAML
+
+    Returns:
+        Path to the YAML file
+    """
+    image_extensions = {'.jpg', '.jpeg', '.png'}
+    images_dir = output_dir / 'images'
+    images_dir.mkdir()
+
+    calib_images = []
+    with os.scandir(calib_dir) as entries:
+        for entry in entries:
+            ext = os.path.splitext(entry.name)[1].lower()
+            if entry.is_file() and ext in image_extensions:
+                # Numbered names avoid collisions; symlink, or copy where
+                # the filesystem does not allow links
+                link_path = images_dir / f"{len(calib_images):05d}{ext}"
+                try:
+                    os.symlink(entry.path, link_path)
+                except OSError:
+                    shutil.copyfile(entry.path, link_path)
+                calib_images.append(str(link_path))
+                if len(calib_images) >= num_images:
+                    break
+
+    if not calib_images:
+        raise FileNotFoundError(f"No calibration images found in {calib_dir}")
+
+    list_path = output_dir / 'calib_images.txt'
+    list_path.write_text("\n".join(calib_images) + "\n")
+
+    yaml_path = output_dir / 'calib.yaml'
+    with open(yaml_path, 'w') as yaml_file:
+        yaml_file.write(f"train: {list_path}\n")
+        yaml_file.write(f"val: {list_path}\n")
+        yaml_file.write("names:\n")
+        for class_id, class_name in sorted(names.items()):
+            yaml_file.write(f"  {class_id}: {class_name}\n")
+
+    print(f"[INFO] Calibrating on {len(calib_images)} images from {calib_dir}")
+    return yaml_path
+
+
+def export_openvino_int8(model_path: Path, data: str, calib_dir: str,
+                         num_images: int, imgsz: int) -> Path:
+    """
+    Export YOLOv8 weights to an INT8-quantized OpenVINO model for CPU.
+
+    Args:
+        model_path: Path to .pt weights
+        data: Dataset YAML for calibration (optional if calib_dir given)
+        calib_dir: Folder of representative images (used when data is None)
+        num_images: Number of calibration images taken from calib_dir
+        imgsz: Input image size (square)
+
+    Returns:
+        Path to the exported OpenVINO model directory
+    """
+    from ultralytics import YOLO
+
+    print(f"[INFO] Loading model from: {model_path}")
+    model = YOLO(str(model_path))
+
+    # Calibration files only need to live until export finishes
+    with tempfile.TemporaryDirectory(prefix='calib_') as tmp_dir:
+        if data is None:
+            data = str(write_calibration_yaml(
+                Path(calib_dir), model.names, num_images, Path(tmp_dir)
+            ))
+
+        print(f"[INFO] Exporting OpenVINO INT8 model (imgsz={imgsz})...")
+        model_dir = model.export(
+            format='openvino',
+            int8=True,
+            data=data,
+            imgsz=imgsz
+        )
+
+    return Path(model_dir)
+
+
+def main():
+    """Main export function"""
+    parser = argparse.ArgumentParser(
+        description='Export YOLOv8 deer detection model for optimized inference',
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+
+    parser.add_argument(
+        '--model',
+        type=str,
+        default='src/models/yolov8n_deer.pt',
+        help='Path to model file (default: src/models/yolov8n_deer.pt)'
+    )
+
+    parser.add_argument(
+        '--format',
+        choices=['engine', 'openvino'],
+        default='engine',
+        help='Export format: engine (TensorRT FP16, GPU) or openvino (INT8, CPU) (default: engine)'
+    )
+
+    parser.add_argument(
+        '--batch',
+        type=int,
+        default=16,
+        help='Maximum inference batch size (default: 16)'
+    )
+
+    parser.add_argument(
+        '--imgsz',
+        type=int,
+        default=640,
+        help='Input image size (default: 640)'
+    )
+
+    parser.add_argument(
+        '--device',
+        type=str,
+        default='0',
+        help='CUDA device index (default: 0)'
+    )
+
+    parser.add_argument(
+        '--data',
+        type=str,
+        help='Dataset YAML for INT8 calibration (openvino only)'
+    )
+
+    parser.add_argument(
+        '--calib-dir',
+        type=str,
+        default='/mnt/i/Hopkins_Ranch_Trail_Cam_Pics/Sanctuary',
+        help='Image folder for INT8 calibration when --data is not given (default: Sanctuary)'
+    )
+
+    parser.add_argument(
+        '--calib-images',
+        type=int,
+        default=100,
+        help='Number of calibration images taken from --calib-dir (default: 100)'
+    )
+
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("YOLOv8 Inference Export")
+    print("=" * 70)
+    print()
+
+    model_path = PROJECT_ROOT / args.model
+    if not model_path.exists():
+        print(f"[FAIL] Model file not found: {model_path}")
+        print("[INFO] Run: ./scripts/copy_models.sh")
+        sys.exit(1)
+
+    try:
+        if args.format == 'openvino':
+            output_path = export_openvino_int8(
+                model_path, args.data, args.calib_dir, args.calib_images, args.imgsz
+            )
+            backend = 'openvino_int8'
+        else:
+            output_path = export_engine(model_path, args.batch, args.imgsz, args.device)
+            backend = 'tensorrt'
+    except ImportError:
+        print("[FAIL] ultralytics package not installed")
+        print("[INFO] Install with: pip install ultralytics")
+        sys.exit(1)
+    except Exception as e:
+        print(f"[FAIL] Export failed: {e}")
+        if args.format == 'openvino':
+            print("[INFO] OpenVINO INT8 export requires the openvino and nncf packages")
+        else:
+            print("[INFO] TensorRT export requires an NVIDIA GPU and the tensorrt package")
+        sys.exit(1)
+
+    print(f"[OK] Exported to: {output_path}")
+    print()
+    print("[INFO] Test it with:")
+    print(f"       python3 scripts/test_detection.py --backend {backend}")
+
+
+if __name__ == '__main__':
+    main()
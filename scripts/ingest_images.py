@@ -15,13 +15,19 @@ Directory structure expected:
         ...
 
 Usage:
-    python3 scripts/ingest_images.py [--workers N] [--batch-size N] [--dry-run]
+    python3 scripts/ingest_images.py [--workers N] [--batch-size N] [--dry-run] [--full-exif]
+                                     [--bulk-initial] [--drop-indexes]
 
 Arguments:
     --workers N       Number of worker threads (default: 10)
     --batch-size N    Database commit batch size (default: 100)
     --dry-run        Scan and report without inserting to database
     --location NAME   Process only specific location folder
+    --full-exif       Store every EXIF tag in exif_data (default: timestamp only)
+    --bulk-initial    Load via an UNLOGGED staging table, then merge in one
+                      INSERT ... SELECT (fast first-time ingest of large libraries)
+    --drop-indexes    Drop secondary indexes on images during the load and
+                      rebuild them once afterwards
 
 Environment:
     IMAGE_PATH: Root directory containing location folders (from .env)
@@ -30,78 +36,136 @@ Environment:
 import os
 import sys
 import argparse
+import queue
+import struct
+import threading
+from collections import deque
+from itertools import count, islice
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from threading import Lock
-import json
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+import orjson
+import piexif
 from PIL import Image
 from PIL.ExifTags import TAGS
+from sqlalchemy import JSON, Index, MetaData, Text, bindparam, cast, insert, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
-from sqlalchemy.exc import IntegrityError
 
-from backend.core.database import get_db, test_connection
+from backend.core.database import engine, get_db, get_thread_session, test_connection
 from backend.models.image import Image as ImageModel, ProcessingStatus
 from backend.models.location import Location
 
 
+class AtomicCounter:
+    """
+    Lock-free counter built on itertools.count.
+
+    WHY: next() on itertools.count is a single C call and cannot be
+    interrupted by another thread, so increments need no Lock. The current
+    value is the difference between the increment counter and a separate
+    read counter (each read advances both by one).
+
+    Reads are intended for a single reader thread (the main thread's
+    progress reporting); concurrent readers may briefly see off-by-one values.
+    """
+
+    def __init__(self):
+        self._increments = count()
+        self._reads = count()
+
+    def increment(self, n: int = 1):
+        if n == 1:
+            next(self._increments)
+        else:
+            # Advance by n in C (itertools "consume" recipe)
+            deque(islice(self._increments, n), maxlen=0)
+
+    @property
+    def value(self) -> int:
+        return next(self._increments) - next(self._reads)
+
+
 # Thread-safe counters
 class ProgressTracker:
-    """Thread-safe progress tracking."""
+    """Thread-safe progress tracking without lock contention between workers."""
 
     def __init__(self):
-        self.lock = Lock()
-        self.found = 0
-        self.processed = 0
-        self.inserted = 0
-        self.skipped = 0
-        self.failed = 0
+        self._found = AtomicCounter()
+        self._processed = AtomicCounter()
+        self._inserted = AtomicCounter()
+        self._skipped = AtomicCounter()
+        self._failed = AtomicCounter()
+        # list.append is atomic under the GIL
         self.errors: List[str] = []
 
     def increment_found(self):
-        with self.lock:
-            self.found += 1
+        self._found.increment()
 
-    def increment_processed(self):
-        with self.lock:
-            self.processed += 1
+    def increment_processed(self, n: int = 1):
+        self._processed.increment(n)
 
-    def increment_inserted(self):
-        with self.lock:
-            self.inserted += 1
+    def increment_inserted(self, n: int = 1):
+        self._inserted.increment(n)
 
-    def increment_skipped(self):
-        with self.lock:
-            self.skipped += 1
+    def increment_skipped(self, n: int = 1):
+        self._skipped.increment(n)
 
-    def increment_failed(self):
-        with self.lock:
-            self.failed += 1
+    def increment_failed(self, n: int = 1):
+        self._failed.increment(n)
 
     def add_error(self, error: str):
-        with self.lock:
-            self.errors.append(error)
+        self.errors.append(error)
 
     def get_stats(self) -> Dict[str, int]:
-        with self.lock:
-            return {
-                "found": self.found,
-                "processed": self.processed,
-                "inserted": self.inserted,
-                "skipped": self.skipped,
-                "failed": self.failed,
-                "errors": len(self.errors)
-            }
+        return {
+            "found": self._found.value,
+            "processed": self._processed.value,
+            "inserted": self._inserted.value,
+            "skipped": self._skipped.value,
+            "failed": self._failed.value,
+            "errors": len(self.errors)
+        }
 
 
 # Global progress tracker
 progress = ProgressTracker()
 
+# Bytes read from the start of each image for EXIF parsing
+# (APP1 segments are limited to 64 KB; the rest covers preceding segments)
+EXIF_HEADER_BYTES = 128 * 1024
+
+# File signatures piexif can parse straight from the header bytes
+JPEG_SOI = b'\xff\xd8'
+TIFF_HEADERS = (b'II*\x00', b'MM\x00*')
+
+# Tag pointing at the Exif sub-IFD (DateTimeOriginal/DateTimeDigitized)
+EXIF_IFD_POINTER = 0x8769
+
+# Maximum queued tasks per worker thread (bounds pending Future objects)
+MAX_IN_FLIGHT_PER_WORKER = 4
+
+# Rows per server-side cursor fetch when loading existing image paths
+PATH_FETCH_SIZE = 10000
+
+# Unlogged staging copy of the images table used by --bulk-initial
+STAGING_TABLE = ImageModel.__table__.to_metadata(MetaData(), name="images_staging")
+
+# Images found by the scanner thread, waiting to be submitted to workers
+scan_queue: "queue.Queue[Optional[Tuple[str, str, str]]]" = queue.Queue(maxsize=10000)
+
+# exif_data arrives pre-encoded from orjson. Binding it as text and casting
+# in SQL skips the JSON column's json.dumps bind processor (one encode per image).
+EXIF_JSON = cast(bindparam("exif_json", type_=Text), JSON)
+
+# Rows waiting for the database writer thread (bounded for backpressure)
+row_queue: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue(maxsize=10000)
+
 
 def load_env_config() -> Dict[str, str]:
     """
@@ -159,238 +223,580 @@ def get_image_path() -> Path:
     return path
 
 
-def extract_exif_data(image_path: Path) -> Tuple[Optional[datetime], Optional[Dict[str, Any]]]:
+def _file_mtime(image_path: str) -> datetime:
+    """Return file modification time as a datetime (timestamp fallback)."""
+    return datetime.fromtimestamp(os.path.getmtime(image_path))
+
+
+def parse_exif_datetime(value: bytes) -> datetime:
+    """
+    Parse a fixed-layout EXIF timestamp ("2024:01:15 14:30:45").
+
+    WHY: datetime.strptime re-interprets the format string on every call.
+    EXIF timestamps always use the same layout, so slicing and int() is
+    several times faster per image.
+
+    Args:
+        value: Raw EXIF DateTime* bytes from piexif
+
+    Returns:
+        datetime: Parsed timestamp
+
+    Raises:
+        ValueError: If the value is truncated or not a valid date/time
+    """
+    return datetime(
+        int(value[0:4]), int(value[5:7]), int(value[8:10]),
+        int(value[11:13]), int(value[14:16]), int(value[17:19])
+    )
+
+
+def find_exif_segment(head: bytes) -> Optional[bytes]:
+    """
+    Locate the APP1 Exif payload in the first bytes of a JPEG.
+
+    WHY: piexif.load(bytes) walks every segment up to SOS and fails when a
+    later one (ICC profile, XMP, MPF) is cut off by the header read, even if
+    the Exif segment itself is complete. Only the Exif segment is needed.
+
+    Args:
+        head: Leading bytes of a JPEG file
+
+    Returns:
+        bytes: Segment payload ("Exif\\0\\0" + TIFF data), or None if there is
+               no Exif APP1 segment ending inside head
+    """
+    pos = 2
+    while pos + 4 <= len(head):
+        if head[pos] != 0xFF:
+            return None
+        marker = head[pos + 1]
+        if marker == 0xFF:
+            # Fill byte before a marker
+            pos += 1
+            continue
+        if marker in (0xD9, 0xDA):
+            # EOI / start of scan: no metadata segments follow
+            return None
+
+        (length,) = struct.unpack('>H', head[pos + 2:pos + 4])
+        end = pos + 2 + length
+        if marker == 0xE1 and head[pos + 4:pos + 10] == b'Exif\x00\x00':
+            return head[pos + 4:end] if end <= len(head) else None
+        pos = end
+
+    return None
+
+
+def read_exif(image_path: str) -> Dict[str, Any]:
+    """
+    Parse EXIF from a single read of the file header.
+
+    WHY: The EXIF APP1 segment sits at the start of a JPEG. One read of
+    EXIF_HEADER_BYTES replaces piexif's segment-by-segment reads and seeks,
+    which matters on network-mounted trail camera storage. piexif only
+    understands JPEG and TIFF, so other formats (PNG eXIf chunks) are read
+    through Pillow instead.
+
+    Args:
+        image_path: Path to image file
+
+    Returns:
+        dict: piexif-style IFD dictionary ('0th', 'Exif', ...); empty if
+              no EXIF could be parsed from the header
+    """
+    with open(image_path, 'rb') as f:
+        head = f.read(EXIF_HEADER_BYTES)
+
+    if head[:2] == JPEG_SOI:
+        segment = find_exif_segment(head)
+        if segment is None:
+            # No Exif APP1 segment within the header read. Re-reading the
+            # whole file costs more than it is worth; the caller uses mtime.
+            return {}
+        return piexif.load(segment)
+
+    if head[:4] in TIFF_HEADERS:
+        try:
+            return piexif.load(head)
+        except (piexif.InvalidImageDataError, struct.error):
+            # IFDs point past the header read; the caller uses file mtime
+            return {}
+
+    return read_pil_exif(image_path)
+
+
+def read_pil_exif(image_path: str) -> Dict[str, Any]:
+    """
+    Read EXIF via Pillow for formats piexif cannot parse (e.g. PNG).
+
+    Args:
+        image_path: Path to image file
+
+    Returns:
+        dict: piexif-style IFD dictionary; empty if the image has no EXIF
+    """
+    with Image.open(image_path) as img:
+        exif = img.getexif()
+        if not exif:
+            return {}
+        return {'0th': dict(exif), 'Exif': dict(exif.get_ifd(EXIF_IFD_POINTER))}
+
+
+def extract_exif_data(
+    image_path: str,
+    full_exif: bool = False
+) -> Tuple[Optional[datetime], Optional[str]]:
     """
     Extract EXIF metadata from image file.
 
+    WHY: Ingestion only needs the capture timestamp. piexif parses just the
+    APP1/EXIF segment (a few KB) without Pillow opening the JPEG and building
+    a full tag dictionary. The complete tag dump is only read with --full-exif.
+
     Args:
         image_path: Path to image file
+        full_exif: If True, also read every EXIF tag for storage in exif_data
 
     Returns:
-        tuple: (timestamp, exif_dict) - timestamp from EXIF or file mtime, full EXIF data
+        tuple: (timestamp, exif_json) - timestamp from EXIF or file mtime,
+               EXIF data already encoded as JSON text (None unless full_exif
+               is set or extraction failed)
     """
     try:
-        # Open image and extract EXIF
-        with Image.open(image_path) as img:
-            exif_data = img._getexif()
-
-            if not exif_data:
-                # No EXIF data, use file modification time
-                mtime = datetime.fromtimestamp(image_path.stat().st_mtime)
-                return mtime, {}
-
-            # Convert EXIF tags to readable names
-            exif_dict = {
-                TAGS.get(tag, tag): value
-                for tag, value in exif_data.items()
-            }
-
-            # Extract timestamp from EXIF
-            timestamp = None
-            for date_tag in ['DateTimeOriginal', 'DateTime', 'DateTimeDigitized']:
-                if date_tag in exif_dict:
-                    try:
-                        # EXIF date format: "2024:01:15 14:30:45"
-                        timestamp = datetime.strptime(
-                            exif_dict[date_tag],
-                            "%Y:%m:%d %H:%M:%S"
-                        )
-                        break
-                    except (ValueError, TypeError):
-                        continue
-
-            # Fall back to file mtime if no EXIF timestamp
-            if not timestamp:
-                timestamp = datetime.fromtimestamp(image_path.stat().st_mtime)
-
-            # Convert non-serializable EXIF values to strings
-            clean_exif = {}
-            for key, value in exif_dict.items():
+        exif = read_exif(image_path)
+
+        # Extract timestamp from EXIF (same tag priority as before)
+        timestamp = None
+        for ifd, date_tag in [
+            ('Exif', piexif.ExifIFD.DateTimeOriginal),
+            ('0th', piexif.ImageIFD.DateTime),
+            ('Exif', piexif.ExifIFD.DateTimeDigitized),
+        ]:
+            value = exif.get(ifd, {}).get(date_tag)
+            if value:
                 try:
-                    # Test if value is JSON serializable
-                    json.dumps(value)
-                    clean_exif[key] = value
+                    timestamp = parse_exif_datetime(value)
+                    break
                 except (TypeError, ValueError):
-                    # Convert to string if not serializable
-                    clean_exif[key] = str(value)
+                    continue
+
+        # Fall back to file mtime if no EXIF timestamp
+        if not timestamp:
+            timestamp = _file_mtime(image_path)
 
-            return timestamp, clean_exif
+        if not full_exif:
+            return timestamp, None
+
+        return timestamp, extract_full_exif(image_path)
 
     except Exception as e:
         # If EXIF extraction fails, use file mtime
         try:
-            mtime = datetime.fromtimestamp(image_path.stat().st_mtime)
-            return mtime, {"error": f"EXIF extraction failed: {str(e)}"}
+            error = {"error": f"EXIF extraction failed: {str(e)}"}
+            return _file_mtime(image_path), orjson.dumps(error).decode()
         except Exception:
-            return None, {"error": f"Failed to get timestamp: {str(e)}"}
+            error = {"error": f"Failed to get timestamp: {str(e)}"}
+            return None, orjson.dumps(error).decode()
 
 
-def find_images(root_path: Path, location_filter: Optional[str] = None) -> List[Tuple[Path, str]]:
+def extract_full_exif(image_path: str) -> Optional[str]:
+    """
+    Read every EXIF tag via Pillow for storage in Image.exif_data.
+
+    Only used with --full-exif; the default ingestion path skips this.
+
+    Args:
+        image_path: Path to image file
+
+    Returns:
+        str: EXIF tag name -> value mapping encoded as JSON text, or None
+    """
+    with Image.open(image_path) as img:
+        exif_data = img._getexif()
+
+    if not exif_data:
+        return None
+
+    # Convert EXIF tags to readable names
+    exif_dict = {
+        TAGS.get(tag, tag): value
+        for tag, value in exif_data.items()
+    }
+
+    # Serialize the whole dict in one C-level pass; non-serializable values
+    # (bytes, IFDRational, ...) fall back to str() and int tag ids become
+    # string keys. The text is bound as-is (see EXIF_JSON), never re-encoded.
+    return orjson.dumps(exif_dict, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def iter_images(root: str, extensions: Tuple[str, ...]) -> Iterator[Tuple[str, str]]:
+    """
+    Recursively yield image file paths under root using os.scandir.
+
+    WHY: Path.rglob('*') builds a Path object for every directory entry.
+    scandir exposes the raw entry name (and the directory flag from the
+    dirent) so only matching files are turned into paths.
+
+    Args:
+        root: Directory to walk
+        extensions: Lowercase file extensions to match (e.g. '.jpg')
+
+    Yields:
+        tuple: (path, filename) of each matching image file
+
+    Unreadable directories are recorded in progress errors and skipped, so
+    one bad folder does not end the scan of every remaining location.
+    """
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.lower().endswith(extensions):
+                        yield entry.path, entry.name
+        except OSError as e:
+            print(f"[WARN] Skipping unreadable directory {directory}: {e}")
+            progress.add_error(f"Cannot read directory {directory}: {str(e)}")
+
+
+def find_images(
+    root_path: Path,
+    location_map: Dict[str, str],
+    location_filter: Optional[str] = None
+) -> Iterator[Tuple[str, str, str]]:
     """
     Scan directory for images organized in location folders.
 
+    Images are yielded as they are discovered so callers can start
+    processing before the scan finishes.
+
+    Each location folder is resolved once and its location UUID looked up
+    once, so workers receive ready-to-insert values instead of calling
+    Path.resolve() and hitting location_map per image.
+
     Args:
         root_path: Root directory containing location folders
+        location_map: Mapping of location name -> location UUID
         location_filter: Optional location name to filter by
 
-    Returns:
-        list: List of (image_path, database_location_name) tuples
+    Yields:
+        tuple: (absolute_path, filename, location_id) for each image
     """
-    valid_extensions = {'.jpg', '.jpeg', '.png', '.JPG', '.JPEG', '.PNG'}
-    images = []
+    valid_extensions = ('.jpg', '.jpeg', '.png')
 
     print("[INFO] Scanning directory structure...")
 
     # Scan all subdirectories in root path
     if not root_path.exists():
         print(f"[FAIL] Root path does not exist: {root_path}")
-        return images
-
-    # Get all directories in root path
-    all_folders = [d for d in root_path.iterdir() if d.is_dir()]
+        return
+
+    # List the root once; map lowercase folder name -> actual entry so
+    # location folders match case-insensitively without stat() probes
+    folders_by_name = {
+        entry.name.lower(): entry
+        for entry in os.scandir(root_path)
+        if entry.is_dir()
+    }
 
-    print(f"[INFO] Found {len(all_folders)} folders in {root_path}")
-    for folder in sorted(all_folders):
-        print(f"       - {folder.name}")
+    print(f"[INFO] Found {len(folders_by_name)} folders in {root_path}")
+    for folder_name in sorted(entry.name for entry in folders_by_name.values()):
+        print(f"       - {folder_name}")
     print()
 
-    # Expected location mappings (database name -> possible folder names)
-    location_mappings = {
-        'Hayfield': ['Hayfield', 'HAYFIELD', 'hayfield'],
-        '270_Jason': ['270_Jason', '270_JASON', '270_jason'],
-        'Sanctuary': ['Sanctuary', 'SANCTUARY', 'sanctuary'],
-        'TinMan': ['TinMan', 'TINMAN', 'tinman', 'Tinman'],
-        'Camphouse': ['Camphouse', 'CAMPHOUSE', 'camphouse'],
-        'Phils_Secret_Spot': ['Phils_Secret_Spot', 'PHILS_SECRET_SPOT', 'phils_secret_spot'],
-    }
+    # Expected location names (folder names match case-insensitively)
+    location_names = [
+        'Hayfield',
+        '270_Jason',
+        'Sanctuary',
+        'TinMan',
+        'Camphouse',
+        'Phils_Secret_Spot',
+    ]
 
     # Filter if requested
     if location_filter:
-        if location_filter not in location_mappings:
+        if location_filter not in location_names:
             print(f"[WARN] Unknown location: {location_filter}")
-            print(f"[INFO] Valid locations: {', '.join(location_mappings.keys())}")
-            return images
-        location_mappings = {location_filter: location_mappings[location_filter]}
+            print(f"[INFO] Valid locations: {', '.join(location_names)}")
+            return
+        location_names = [location_filter]
 
     # Process each location
-    for db_location_name, possible_folder_names in location_mappings.items():
-        folder_found = False
+    for db_location_name in location_names:
+        folder = folders_by_name.get(db_location_name.lower())
+        if folder is None:
+            print(f"[WARN] Location folder not found: {db_location_name} (case-insensitive)")
+            continue
+
+        print(f"[INFO] Scanning: {folder.name} -> {db_location_name}")
 
-        # Try to find matching folder (case-insensitive)
-        for folder_name in possible_folder_names:
-            location_path = root_path / folder_name
+        location_id = location_map.get(db_location_name)
+        if not location_id:
+            print(f"[WARN] Location not in database: {db_location_name} (skipping folder)")
+            continue
+
+        # Resolve once per folder; entries below inherit the absolute path
+        resolved_path = os.path.realpath(folder.path)
+
+        # Find all images in location folder (including subdirectories)
+        folder_count = 0
+        for image_file, filename in iter_images(resolved_path, valid_extensions):
+            progress.increment_found()
+            folder_count += 1
+            yield image_file, filename, location_id
 
-            if location_path.exists() and location_path.is_dir():
-                folder_found = True
-                print(f"[INFO] Scanning: {folder_name} -> {db_location_name}")
+        print(f"[INFO] Found {folder_count} images in {folder.name}")
 
-                # Find all images in location folder (including subdirectories)
-                folder_count = 0
-                for image_path in location_path.rglob('*'):
-                    if image_path.is_file() and image_path.suffix in valid_extensions:
-                        # Use database location name for mapping
-                        images.append((image_path, db_location_name))
-                        progress.increment_found()
-                        folder_count += 1
 
-                print(f"[INFO] Found {folder_count} images in {folder_name}")
-                break
+def scan_images(
+    root_path: Path,
+    location_map: Dict[str, str],
+    location_filter: Optional[str] = None
+) -> None:
+    """
+    Feed find_images() results into scan_queue, then a None sentinel.
 
-        if not folder_found:
-            print(f"[WARN] Location folder not found: {db_location_name} (tried: {', '.join(possible_folder_names)})")
+    Runs in its own thread so directory traversal overlaps with EXIF
+    extraction and database writes.
 
-    return images
+    Args:
+        root_path: Root directory containing location folders
+        location_map: Mapping of location name -> location UUID
+        location_filter: Optional location name to filter by
+    """
+    try:
+        for image_info in find_images(root_path, location_map, location_filter):
+            scan_queue.put(image_info)
+    except Exception as e:
+        print(f"[FAIL] Failed to scan directory: {e}")
+        progress.add_error(f"Directory scan failed: {str(e)}")
+    finally:
+        scan_queue.put(None)
 
 
 def process_image(
-    image_info: Tuple[Path, str],
-    location_map: Dict[str, str],
-    dry_run: bool = False
+    image_info: Tuple[str, str, str],
+    existing_paths: Set[str],
+    dry_run: bool = False,
+    full_exif: bool = False
 ) -> bool:
     """
     Process a single image: extract metadata and insert to database.
 
     Args:
-        image_info: (image_path, location_name) tuple
-        location_map: Mapping of location name -> location UUID
+        image_info: (absolute_path, filename, location_id) tuple from find_images
+        existing_paths: Paths already in the database (skipped without reading EXIF)
         dry_run: If True, don't insert to database
+        full_exif: If True, store every EXIF tag (not just the timestamp)
 
     Returns:
         bool: True if successful, False otherwise
     """
-    image_path, location_name = image_info
+    path_str, filename, location_id = image_info
 
-    try:
-        # Get location UUID
-        location_id = location_map.get(location_name)
-        if not location_id:
-            progress.add_error(f"Unknown location: {location_name} for {image_path.name}")
-            progress.increment_failed()
-            return False
+    if path_str in existing_paths:
+        progress.increment_skipped()
+        return True
 
+    try:
         # Extract EXIF metadata
-        timestamp, exif_data = extract_exif_data(image_path)
+        timestamp, exif_json = extract_exif_data(path_str, full_exif)
 
         if not timestamp:
-            progress.add_error(f"No timestamp for {image_path}")
+            progress.add_error(f"No timestamp for {path_str}")
             progress.increment_failed()
             return False
 
-        # Prepare image record
-        filename = image_path.name
-        path_str = str(image_path.resolve())
-
         # Skip if dry run
         if dry_run:
             progress.increment_processed()
             return True
 
-        # Insert to database
-        db = next(get_db())
-        try:
-            # Check if already exists (by path - unique constraint)
-            existing = db.query(ImageModel).filter(ImageModel.path == path_str).first()
-
-            if existing:
-                progress.increment_skipped()
-                return True
-
-            # Create new image record
-            image = ImageModel(
-                filename=filename,
-                path=path_str,
-                timestamp=timestamp,
-                location_id=location_id,
-                exif_data=exif_data if exif_data else None,
-                processing_status=ProcessingStatus.PENDING
-            )
+        # Hand the row to the single database writer thread
+        row_queue.put({
+            "filename": filename,
+            "path": path_str,
+            "timestamp": timestamp,
+            "location_id": location_id,
+            "exif_json": exif_json,
+            "processing_status": ProcessingStatus.PENDING,
+        })
+        return True
 
-            db.add(image)
-            db.commit()
+    except Exception as e:
+        progress.add_error(f"Processing error for {path_str}: {str(e)}")
+        progress.increment_failed()
+        return False
 
-            progress.increment_inserted()
-            progress.increment_processed()
-            return True
 
-        except IntegrityError as e:
-            db.rollback()
-            # Likely duplicate path - count as skipped
-            progress.increment_skipped()
-            return True
+def flush_batch(db: Session, batch: List[Dict[str, Any]], staging: bool = False) -> None:
+    """
+    Insert a batch of image rows in one multi-row statement.
 
-        except Exception as e:
-            db.rollback()
-            progress.add_error(f"Database error for {filename}: {str(e)}")
-            progress.increment_failed()
-            return False
+    Existing paths are skipped by the unique constraint on images.path
+    (ON CONFLICT DO NOTHING) instead of a SELECT per image. RETURNING id
+    gives the number of rows actually inserted.
 
-        finally:
-            db.close()
+    Args:
+        db: Database session
+        batch: Image row dictionaries from process_image
+        staging: If True, append to the unlogged staging table instead
+                 (duplicates are resolved later by merge_staging_table)
+    """
+    try:
+        if staging:
+            db.execute(insert(STAGING_TABLE).values(exif_data=EXIF_JSON), batch)
+            db.commit()
+            progress.increment_processed(len(batch))
+            return
+
+        stmt = (
+            pg_insert(ImageModel)
+            .values(exif_data=EXIF_JSON)
+            .on_conflict_do_nothing(index_elements=[ImageModel.path])
+            .returning(ImageModel.id)
+        )
+        inserted = len(db.execute(stmt, batch).all())
+        db.commit()
+
+        progress.increment_inserted(inserted)
+        progress.increment_processed(inserted)
+        progress.increment_skipped(len(batch) - inserted)
 
     except Exception as e:
-        progress.add_error(f"Processing error for {image_path}: {str(e)}")
-        progress.increment_failed()
-        return False
+        db.rollback()
+        progress.add_error(f"Database error for batch of {len(batch)} images: {str(e)}")
+        progress.increment_failed(len(batch))
+
+
+def db_writer(batch_size: int, staging: bool = False) -> None:
+    """
+    Drain row_queue and insert rows in batches until a None sentinel arrives.
+
+    WHY: A single writer with batched inserts replaces one session, one
+    SELECT, and one INSERT+COMMIT per image across all worker threads.
+
+    Args:
+        batch_size: Number of rows per INSERT/COMMIT
+        staging: If True, write to the unlogged staging table (--bulk-initial)
+    """
+    db = get_thread_session()
+    batch: List[Dict[str, Any]] = []
+    while True:
+        row = row_queue.get()
+        if row is None:
+            break
+        batch.append(row)
+        if len(batch) >= batch_size:
+            flush_batch(db, batch, staging)
+            batch = []
+
+    if batch:
+        flush_batch(db, batch, staging)
+
+
+def create_staging_table(db: Session) -> None:
+    """
+    Create an empty UNLOGGED copy of the images table for --bulk-initial.
+
+    WHY: Unlogged tables skip WAL and have no indexes, so a large first-time
+    load only pays for heap writes. The unique path index on images is
+    maintained once, in bulk, by merge_staging_table().
+
+    A staging table left behind by a failed merge is merged into images
+    first, so its rows are not lost when the table is recreated.
+
+    Args:
+        db: Database session
+    """
+    leftover = db.execute(
+        text("SELECT to_regclass(:name)"), {"name": STAGING_TABLE.name}
+    ).scalar()
+    if leftover is not None:
+        print(f"[INFO] Merging rows left in {STAGING_TABLE.name} by a previous run...")
+        merged = merge_staging_table(db)
+        print(f"[OK] Merged {merged} leftover images")
+
+    db.execute(text(
+        f"CREATE UNLOGGED TABLE {STAGING_TABLE.name} (LIKE images INCLUDING DEFAULTS)"
+    ))
+    db.commit()
+
+
+def merge_staging_table(db: Session) -> int:
+    """
+    Move staged rows into images in one statement and drop the staging table.
+
+    Rows whose path already exists in images are skipped (ON CONFLICT).
+
+    Args:
+        db: Database session
+
+    Returns:
+        int: Number of rows inserted into images
+    """
+    columns = ", ".join(column.name for column in ImageModel.__table__.columns)
+    result = db.execute(text(
+        f"INSERT INTO images ({columns}) "
+        f"SELECT {columns} FROM {STAGING_TABLE.name} "
+        f"ON CONFLICT (path) DO NOTHING"
+    ))
+    db.execute(text(f"DROP TABLE {STAGING_TABLE.name}"))
+    db.commit()
+    return result.rowcount
+
+
+def drop_secondary_indexes() -> List[Index]:
+    """
+    Drop the non-unique indexes on images before a bulk load (--drop-indexes).
+
+    WHY: Every inserted row otherwise pays a B-tree insert per index.
+    Rebuilding afterwards sorts all keys once. The unique index on
+    images.path is kept because ON CONFLICT (path) depends on it.
+
+    Returns:
+        list: Indexes that were dropped (pass to create_secondary_indexes)
+    """
+    indexes = [index for index in ImageModel.__table__.indexes if not index.unique]
+    for index in indexes:
+        index.drop(bind=engine, checkfirst=True)
+        print(f"[INFO] Dropped index {index.name}")
+    return indexes
+
+
+def create_secondary_indexes(indexes: List[Index]) -> None:
+    """
+    Rebuild indexes dropped by drop_secondary_indexes().
+
+    Args:
+        indexes: Indexes returned by drop_secondary_indexes
+    """
+    for index in indexes:
+        index.create(bind=engine, checkfirst=True)
+        print(f"[OK] Rebuilt index {index.name}")
+
+
+def load_existing_paths(db: Session) -> Set[str]:
+    """
+    Load all image paths already in the database.
+
+    WHY: One query up front replaces a SELECT per image. Re-runs skip known
+    files before reading EXIF. Memory is ~100 bytes per path. Only the path
+    column is selected, and yield_per streams it through a server-side cursor
+    so the full result set is never buffered alongside the set.
+
+    Args:
+        db: Database session
+
+    Returns:
+        set: Absolute paths of images already ingested
+    """
+    return {path for (path,) in db.query(ImageModel.path).yield_per(PATH_FETCH_SIZE)}
 
 
 def load_location_map(db: Session) -> Dict[str, str]:
@@ -434,6 +840,21 @@ def main():
         type=str,
         help="Process only specific location folder"
     )
+    parser.add_argument(
+        '--full-exif',
+        action='store_true',
+        help="Store all EXIF tags in exif_data (slower; default stores timestamp only)"
+    )
+    parser.add_argument(
+        '--bulk-initial',
+        action='store_true',
+        help="Load through an UNLOGGED staging table (fast first-time ingest)"
+    )
+    parser.add_argument(
+        '--drop-indexes',
+        action='store_true',
+        help="Drop secondary indexes on images during the load and rebuild after"
+    )
 
     args = parser.parse_args()
 
@@ -472,6 +893,10 @@ def main():
         print(f"[OK] Loaded {len(location_map)} locations:")
         for name in sorted(location_map.keys()):
             print(f"     - {name}")
+
+        print("[INFO] Loading existing image paths...")
+        existing_paths = load_existing_paths(db)
+        print(f"[OK] {len(existing_paths)} images already in database")
     except Exception as e:
         print(f"[FAIL] Failed to load locations: {e}")
         sys.exit(1)
@@ -479,47 +904,106 @@ def main():
         db.close()
     print()
 
-    # Scan for images
-    print("[INFO] Scanning for images...")
-    try:
-        images = find_images(image_path, args.location)
-    except Exception as e:
-        print(f"[FAIL] Failed to scan directory: {e}")
-        sys.exit(1)
-
-    if not images:
-        print("[WARN] No images found")
-        sys.exit(0)
-
-    print(f"[OK] Found {len(images)} images")
-    print()
-
-    # Process images with multithreading
-    print(f"[INFO] Processing images with {args.workers} workers...")
+    # Process images with multithreading while the scanner is still running
+    print(f"[INFO] Scanning and processing images with {args.workers} workers...")
     print(f"[INFO] Batch size: {args.batch_size}")
     print()
 
     start_time = datetime.now()
 
-    with ThreadPoolExecutor(max_workers=args.workers) as executor:
-        # Submit all tasks
-        futures = {
-            executor.submit(process_image, img_info, location_map, args.dry_run): img_info
-            for img_info in images
-        }
+    writer = None
+    dropped_indexes: List[Index] = []
+    if not args.dry_run and args.drop_indexes:
+        print("[INFO] Dropping secondary indexes for bulk load...")
+        dropped_indexes = drop_secondary_indexes()
 
-        # Process results as they complete
-        completed = 0
-        for future in as_completed(futures):
-            completed += 1
-
-            # Show progress every 100 images
-            if completed % 100 == 0:
-                stats = progress.get_stats()
-                print(f"[INFO] Progress: {completed}/{len(images)} "
-                      f"(Inserted: {stats['inserted']}, "
-                      f"Skipped: {stats['skipped']}, "
-                      f"Failed: {stats['failed']})")
+    # Rebuild dropped indexes however the load ends (errors, Ctrl-C, exit)
+    try:
+        if not args.dry_run:
+            if args.bulk_initial:
+                print("[INFO] Bulk initial load: writing to unlogged staging table")
+                db = get_thread_session()
+                create_staging_table(db)
+
+            writer = threading.Thread(
+                target=db_writer,
+                args=(args.batch_size, args.bulk_initial),
+                daemon=True
+            )
+            writer.start()
+
+        # Scan in a background thread so processing starts with the first image
+        # found instead of after the whole tree has been walked
+        scanner = threading.Thread(
+            target=scan_images,
+            args=(image_path, location_map, args.location),
+            daemon=True
+        )
+        scanner.start()
+
+        # Keep at most MAX_IN_FLIGHT_PER_WORKER tasks per worker queued so memory
+        # stays O(workers) instead of O(images) Future objects
+        max_in_flight = args.workers * MAX_IN_FLIGHT_PER_WORKER
+
+        with ThreadPoolExecutor(max_workers=args.workers) as executor:
+            in_flight = set()
+            completed = 0
+
+            def report_progress(done_futures):
+                nonlocal completed
+                for _ in done_futures:
+                    completed += 1
+
+                    # Show progress every 100 images
+                    if completed % 100 == 0:
+                        stats = progress.get_stats()
+                        print(f"[INFO] Progress: {completed}/{stats['found']} "
+                              f"(Inserted: {stats['inserted']}, "
+                              f"Skipped: {stats['skipped']}, "
+                              f"Failed: {stats['failed']})")
+
+            for img_info in iter(scan_queue.get, None):
+                if len(in_flight) >= max_in_flight:
+                    # Wait for a slot before submitting more work
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    report_progress(done)
+
+                in_flight.add(executor.submit(
+                    process_image, img_info, existing_paths, args.dry_run, args.full_exif
+                ))
+
+            # Drain remaining tasks
+            for future in as_completed(in_flight):
+                report_progress([future])
+
+        scanner.join()
+        if progress.get_stats()['found'] == 0:
+            print("[WARN] No images found")
+
+        # Signal the writer to flush its last batch and wait for it
+        if writer:
+            print("[INFO] Flushing remaining database inserts...")
+            row_queue.put(None)
+            writer.join()
+
+        if writer and args.bulk_initial:
+            print("[INFO] Merging staging table into images...")
+            staged = progress.get_stats()['processed']
+            try:
+                merged = merge_staging_table(db)
+                progress.increment_inserted(merged)
+                progress.increment_skipped(staged - merged)
+                print(f"[OK] Merged {merged} of {staged} staged images")
+            except Exception as e:
+                db.rollback()
+                print(f"[FAIL] Failed to merge staging table: {e}")
+                print(f"[INFO] Staged rows kept in {STAGING_TABLE.name} "
+                      f"(merged by the next --bulk-initial run)")
+                sys.exit(1)
+    finally:
+        if dropped_indexes:
+            print("[INFO] Rebuilding secondary indexes...")
+            create_secondary_indexes(dropped_indexes)
 
     end_time = datetime.now()
     duration = (end_time - start_time).total_seconds()
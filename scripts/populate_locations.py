@@ -14,6 +14,8 @@ Or from Docker:
 
 import sys
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Dict, Any, List
 
 
@@ -21,6 +23,29 @@ from typing import Dict, Any, List
 API_BASE_URL = "http://localhost:8001"
 LOCATIONS_ENDPOINT = f"{API_BASE_URL}/api/locations"
 
+# Shared HTTP session
+# WHY: Module-level requests.get/post open a new connection per call.
+# One keep-alive session reuses the TCP connection for every request.
+# Transient gateway errors are retried with backoff instead of failing the
+# location outright; a retried POST that already succeeded returns 409,
+# which is reported as already existing. Connection errors are not retried
+# (connect=0) so the health check fails fast when the API is down.
+RETRY = Retry(
+    total=5,
+    connect=0,
+    backoff_factor=0.5,
+    status_forcelist=[502, 503, 504],
+    allowed_methods=frozenset(["GET", "POST"]),
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=RETRY))
+SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=RETRY))
+
+# (connect, read) timeouts in seconds
+REQUEST_TIMEOUT = (3.05, 10)
+
 
 # Camera locations with GPS coordinates
 LOCATIONS = [
@@ -92,11 +117,11 @@ def create_location(location_data: Dict[str, Any]) -> Dict[str, Any]:
         dict: API response containing created location or error
     """
     try:
-        response = requests.post(
+        response = SESSION.post(
             LOCATIONS_ENDPOINT,
             json=location_data,
             headers={"Content-Type": "application/json"},
-            timeout=10
+            timeout=REQUEST_TIMEOUT
         )
 
         # Return response data regardless of status code
@@ -134,7 +159,7 @@ def check_api_health() -> bool:
         bool: True if API is healthy, False otherwise
     """
     try:
-        response = requests.get(f"{API_BASE_URL}/health", timeout=5)
+        response = SESSION.get(f"{API_BASE_URL}/health", timeout=5)
         if response.status_code == 200:
             data = response.json()
             return data.get("status") == "healthy"
@@ -217,7 +242,7 @@ def main():
     print()
     print("[INFO] Fetching all locations from database...")
     try:
-        response = requests.get(LOCATIONS_ENDPOINT, timeout=10)
+        response = SESSION.get(LOCATIONS_ENDPOINT, timeout=REQUEST_TIMEOUT)
         if response.status_code == 200:
             data = response.json()
             print(f"[OK] Total locations in database: {data['total']}")
@@ -21,7 +21,7 @@ from fastapi import (
     status,
 )
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, or_, func
 from PIL import Image as PILImage
 from PIL.ExifTags import TAGS
 
@@ -353,19 +353,26 @@ async def upload_images(
 
         # Queue tasks by name using send_task() to avoid importing worker dependencies
         # WHY: Backend cannot import worker modules (ultralytics/cv2 require GPU libraries)
-        for img_response in uploaded_images:
-            try:
-                # Queue Celery task for detection by name (no import needed)
-                task = celery_app.send_task(
-                    'worker.tasks.detection.detect_deer_task',
-                    args=[str(img_response.id)],
-                    queue='ml_processing'  # Route to ML processing queue
-                )
-                print(f"[OK] Queued detection task {task.id} for image {img_response.id}")
-            except Exception as e:
-                print(f"[ERROR] Failed to queue task for image {img_response.id}: {e}")
-                # Don't fail the upload if queueing fails - image is still saved
-                # User can trigger processing later via batch endpoint
+        # One producer for the whole batch reuses a single broker connection
+        # instead of acquiring one from the pool for every publish
+        try:
+            with celery_app.producer_or_acquire() as producer:
+                for img_response in uploaded_images:
+                    try:
+                        # Queue Celery task for detection by name (no import needed)
+                        task = celery_app.send_task(
+                            'worker.tasks.detection.detect_deer_task',
+                            args=[str(img_response.id)],
+                            queue='ml_processing',  # Route to ML processing queue
+                            producer=producer
+                        )
+                        print(f"[OK] Queued detection task {task.id} for image {img_response.id}")
+                    except Exception as e:
+                        print(f"[ERROR] Failed to queue task for image {img_response.id}: {e}")
+                        # Don't fail the upload if queueing fails - image is still saved
+                        # User can trigger processing later via batch endpoint
+        except Exception as e:
+            print(f"[ERROR] Failed to connect to task queue: {e}")
 
     return BatchUploadResponse(
         total_uploaded=len(uploaded_images),
@@ -491,11 +498,23 @@ def list_images(
             .all()
         )
 
+        # Count detections for the whole page in one grouped query
+        # WHY: img.detections.count() per row issued one COUNT per image (N+1)
+        from backend.models.detection import Detection
+        processed_ids = [img.id for img in images if img.is_processed]
+        detection_counts = {}
+        if processed_ids:
+            detection_counts = dict(
+                db.query(Detection.image_id, func.count(Detection.id))
+                .filter(Detection.image_id.in_(processed_ids))
+                .group_by(Detection.image_id)
+                .all()
+            )
+
         # Convert to response models and add detection count
         image_responses = []
         for img in images:
-            # Count detections for each image
-            detection_count = img.detections.count() if img.is_processed else None
+            detection_count = detection_counts.get(img.id, 0) if img.is_processed else None
 
             img_response = ImageResponse(
                 id=img.id,
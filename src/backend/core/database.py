@@ -9,8 +9,12 @@ Based on specs/system.spec requirements:
 - SSL support for production
 """
 
+import atexit
 import os
-from typing import Generator
+import threading
+from typing import Generator, List
+
+import orjson
 
 from sqlalchemy import create_engine, event, text
 from sqlalchemy.engine import Engine
@@ -60,6 +64,9 @@ engine = create_engine(
     pool_pre_ping=True,  # Verify connections before using
     echo=os.getenv("SQL_ECHO", "false").lower() == "true",  # Log SQL queries in debug mode
     future=True,  # Use SQLAlchemy 2.0 style
+    # orjson for JSON columns (exif_data, bbox); several times faster than stdlib json
+    json_serializer=lambda obj: orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode(),
+    json_deserializer=orjson.loads,
 )
 
 
@@ -118,6 +125,39 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+# Per-thread sessions for long-running threaded scripts (e.g. ingestion)
+_thread_local = threading.local()
+_thread_sessions: List[Session] = []
+
+
+def get_thread_session() -> Session:
+    """
+    Get a database session bound to the calling thread.
+
+    Unlike get_db(), the session is created once per thread and reused for
+    the thread's lifetime, so pool checkout happens once instead of per call.
+    All thread sessions are closed at interpreter exit.
+
+    Returns:
+        Session: SQLAlchemy database session owned by the current thread
+    """
+    db = getattr(_thread_local, "db", None)
+    if db is None:
+        db = SessionLocal()
+        _thread_local.db = db
+        _thread_sessions.append(db)
+    return db
+
+
+def close_thread_sessions() -> None:
+    """Close every session created by get_thread_session()."""
+    while _thread_sessions:
+        _thread_sessions.pop().close()
+
+
+atexit.register(close_thread_sessions)
+
+
 def init_db() -> None:
     """
     Initialize database by creating all tables.
@@ -186,6 +226,8 @@ __all__ = [
     "SessionLocal",
     "Base",
     "get_db",
+    "get_thread_session",
+    "close_thread_sessions",
     "init_db",
     "close_db",
     "get_db_info",
@@ -182,8 +182,9 @@ def detect_deer_task(self, image_id: str) -> Dict:
         model = get_detection_model()
 
         # Run YOLOv8 inference (T010 - with GPU optimization)
-        # Use torch.no_grad() to reduce memory usage
-        with torch.no_grad():
+        # Use torch.inference_mode() to reduce memory usage; unlike no_grad()
+        # it also skips version counters and view tracking on the outputs
+        with torch.inference_mode():
             try:
                 results = model.predict(
                     source=str(image_path),
@@ -202,6 +203,7 @@ def detect_deer_task(self, image_id: str) -> Dict:
         # Process detection results (T008 - FR-003)
         detections_created = []
         detection_count = 0
+        confidence_total = 0.0
 
         if results and len(results) > 0:
             result = results[0]  # Single image result
@@ -212,11 +214,12 @@ def detect_deer_task(self, image_id: str) -> Dict:
             if boxes is not None and len(boxes) > 0:
                 logger.info(f"[INFO] Found {len(boxes)} detections in {image.filename}")
 
+                # One device-to-host copy for all boxes instead of one per field per box
+                # Rows are [x1, y1, x2, y2, confidence, class_id]
+                box_data = boxes.data.cpu().numpy()
+
                 # Create Detection record for each bbox (T008 - FR-003)
-                for i, box in enumerate(boxes):
-                    # Get bbox coordinates (x1, y1, x2, y2 format from YOLO)
-                    xyxy = box.xyxy[0].cpu().numpy()  # [x1, y1, x2, y2]
-                    x1, y1, x2, y2 = xyxy
+                for x1, y1, x2, y2, confidence, class_id in box_data:
 
                     # Convert to (x, y, width, height) format for database
                     bbox_dict = {
@@ -226,9 +229,7 @@ def detect_deer_task(self, image_id: str) -> Dict:
                         "height": int(y2 - y1)
                     }
 
-                    # Get confidence and class_id
-                    confidence = float(box.conf[0])
-                    class_id = int(box.cls[0])
+                    confidence = float(confidence)
 
                     # Create Detection record
                     detection = Detection(
@@ -241,6 +242,7 @@ def detect_deer_task(self, image_id: str) -> Dict:
 
                     db.add(detection)
                     detection_count += 1
+                    confidence_total += confidence
                     detections_created.append(str(detection.id))
 
                 logger.info(f"[OK] Created {detection_count} Detection records for {image_id}")
@@ -256,9 +258,8 @@ def detect_deer_task(self, image_id: str) -> Dict:
         duration = task_end_time - task_start_time
 
         # Log completion (T011 - FR-005: log detection count and duration)
-        avg_confidence = sum(
-            det.confidence for det in db.query(Detection).filter(Detection.image_id == image.id).all()
-        ) / detection_count if detection_count > 0 else 0.0
+        # Averaged in memory - no need to re-query the rows just inserted
+        avg_confidence = confidence_total / detection_count if detection_count > 0 else 0.0
 
         logger.info(
             f"[OK] Detection complete for {image_id}: "
@@ -27,7 +27,9 @@ GPU Configuration:
 
 import os
 import logging
-from typing import List, Dict, Tuple, Optional
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Iterable, Iterator, List, Dict, Tuple, Optional
 from pathlib import Path
 import numpy as np
 from PIL import Image, ExifTags
@@ -53,12 +55,25 @@ BATCH_SIZE = int(os.getenv('BATCH_SIZE', 32))
 DETECTION_BATCH_SIZE = int(os.getenv('DETECTION_BATCH_SIZE', 16))
 CLASSIFICATION_BATCH_SIZE = int(os.getenv('CLASSIFICATION_BATCH_SIZE', 32))
 REID_BATCH_SIZE = int(os.getenv('REID_BATCH_SIZE', 64))
+DECODE_WORKERS = int(os.getenv('DECODE_WORKERS', 4))
+# Images decoded ahead of the GPU (bounds host memory held by decoded crops)
+DECODE_WINDOW = 2 * DECODE_WORKERS
 REID_THRESHOLD = float(os.getenv('REID_THRESHOLD', 0.85))
 FEATURE_DIM = int(os.getenv('FEATURE_DIM', 2048))
 
 # GPU Configuration
 DEVICE = 'cuda' if torch.cuda.is_available() else 'cpu'
 MIXED_PRECISION = os.getenv('MIXED_PRECISION', 'true').lower() == 'true'
+# Autocast only applies to CUDA; on CPU the models run in FP32
+USE_AMP = MIXED_PRECISION and DEVICE == 'cuda'
+# cuDNN autotunes once per distinct input shape and caches the result. Crops
+# are always 224x224, so shapes differ only in batch size: full batches are
+# tuned at load (_warmup), other sizes once per worker when first seen
+torch.backends.cudnn.benchmark = DEVICE == 'cuda'
+# NHWC layout lets cuDNN pick tensor-core convolution kernels
+MEMORY_FORMAT = torch.channels_last if DEVICE == 'cuda' else torch.contiguous_format
+# Opt-in: compile the re-ID model with torch.compile (one-time cost at load)
+TORCH_COMPILE = os.getenv('TORCH_COMPILE', 'false').lower() == 'true'
 
 # Model paths
 MODEL_DIR = Path(os.getenv('MODEL_DIR', '/app/src/models'))
@@ -82,6 +97,56 @@ class ModelCache:
             cls._instance = super(ModelCache, cls).__new__(cls)
         return cls._instance
 
+    @staticmethod
+    def _compile(model, batch_size: int):
+        """
+        Optionally wrap a model with torch.compile at a fixed batch size.
+
+        WHY: Inductor fuses conv/bn/activation and removes per-op dispatcher
+        overhead (10-30% faster for ResNet50). Every call is padded to
+        batch_size (see pad_batch), so dynamic=False compiles and captures
+        one CUDA graph instead of recompiling for each partial batch.
+
+        torch.compile is lazy: a missing backend (triton, C compiler) or a
+        Dynamo error only surfaces on the first forward. That forward runs
+        here, and on any failure the eager model is returned instead.
+        """
+        if not TORCH_COMPILE or not hasattr(torch, 'compile'):
+            return model
+        try:
+            compiled = pad_batch(
+                torch.compile(model, mode='reduce-overhead', dynamic=False), batch_size
+            )
+            dummy = torch.zeros(
+                batch_size, 3, CROP_INPUT_SIZE, CROP_INPUT_SIZE, device=DEVICE
+            ).to(memory_format=MEMORY_FORMAT)
+            with torch.inference_mode(), amp_autocast():
+                compiled(dummy)
+            logger.info(f'[OK] Compiled model for batch size {batch_size}')
+            return compiled
+        except Exception as e:
+            logger.warning(f'[WARN] torch.compile failed, using eager model: {e}')
+            return model
+
+    @staticmethod
+    def _warmup(model, batch_size: int):
+        """
+        Run one dummy forward pass on a freshly loaded model.
+
+        WHY: The first CUDA forward pays for context setup, allocator growth
+        and cuDNN autotuning of that input shape. Warming up at the task's
+        full batch size keeps those costs out of the first real batch; smaller
+        (partial) batch sizes are still tuned the first time they occur.
+        """
+        if DEVICE != 'cuda':
+            return
+        dummy = torch.zeros(
+            batch_size, 3, CROP_INPUT_SIZE, CROP_INPUT_SIZE, device=DEVICE
+        ).to(memory_format=MEMORY_FORMAT)
+        with torch.inference_mode(), amp_autocast():
+            model(dummy)
+        torch.cuda.synchronize()
+
     def get_detection_model(self):
         """Load YOLOv8n detection model"""
         if 'detection' not in self._models:
@@ -102,7 +167,10 @@ class ModelCache:
             try:
                 logger.info('[INFO] Loading classification model...')
                 model = torch.load(str(CLASSIFICATION_MODEL_PATH), map_location=DEVICE)
-                model.eval()
+                # Not compiled: batches are per image (1..N crops), so a fixed
+                # shape would mean padding every image up to the full batch
+                model = model.to(memory_format=MEMORY_FORMAT).eval()
+                self._warmup(model, CLASSIFICATION_BATCH_SIZE)
                 self._models['classification'] = model
                 logger.info('[OK] Classification model loaded')
             except Exception as e:
@@ -116,7 +184,8 @@ class ModelCache:
             try:
                 logger.info('[INFO] Loading re-identification model...')
                 model = torch.load(str(REID_MODEL_PATH), map_location=DEVICE)
-                model.eval()
+                model = self._compile(model.to(memory_format=MEMORY_FORMAT).eval(), REID_BATCH_SIZE)
+                self._warmup(model, REID_BATCH_SIZE)
                 self._models['reid'] = model
                 logger.info('[OK] Re-ID model loaded')
             except Exception as e:
@@ -129,9 +198,66 @@ class ModelCache:
 model_cache = ModelCache()
 
 
+def amp_autocast():
+    """
+    Autocast context for inference forward passes.
+
+    WHY: FP16 on tensor cores gives roughly 2x inference throughput for
+    ResNet50 with negligible accuracy impact. Inference only, so no
+    GradScaler. Callers cast outputs back with .float().
+    """
+    return torch.autocast(device_type='cuda', dtype=torch.float16, enabled=USE_AMP)
+
+
+def pad_batch(model, batch_size: int):
+    """
+    Wrap a model so every forward runs at exactly batch_size.
+
+    WHY: A compiled model with dynamic=False recompiles for each new input
+    shape. Short batches are zero-padded to batch_size and the padding rows
+    are sliced off the output, so only one shape is ever compiled.
+
+    Args:
+        model: Model (typically torch.compile'd) taking an NCHW batch
+        batch_size: Fixed batch size to run at
+
+    Returns:
+        Callable with the same batch -> output contract as model
+    """
+    def forward(batch: torch.Tensor) -> torch.Tensor:
+        num = batch.shape[0]
+        if num < batch_size:
+            padding = batch.new_zeros((batch_size - num, *batch.shape[1:]))
+            batch = torch.cat([batch, padding]).contiguous(memory_format=MEMORY_FORMAT)
+        return model(batch)[:num]
+
+    return forward
+
+
+def to_device(crops: List[torch.Tensor]) -> torch.Tensor:
+    """
+    Stack preprocessed crops into a batch on DEVICE.
+
+    WHY: Copies from pageable memory are staged and block the host. A pinned
+    batch is copied asynchronously, so the worker thread returns to stacking
+    and decoding the next batch while the transfer and forward pass run.
+
+    Args:
+        crops: CHW crop tensors from preprocess_transform
+
+    Returns:
+        NCHW batch on DEVICE in MEMORY_FORMAT
+    """
+    batch = torch.stack(crops)
+    if DEVICE == 'cuda':
+        batch = batch.pin_memory()
+    return batch.to(DEVICE, memory_format=MEMORY_FORMAT, non_blocking=True)
+
+
 # Image preprocessing transforms
+CROP_INPUT_SIZE = 224
 preprocess_transform = transforms.Compose([
-    transforms.Resize((224, 224)),
+    transforms.Resize((CROP_INPUT_SIZE, CROP_INPUT_SIZE)),
     transforms.ToTensor(),
     transforms.Normalize(mean=[0.485, 0.456, 0.406], std=[0.229, 0.224, 0.225])
 ])
@@ -173,6 +299,96 @@ def extract_exif_data(image_path: Path) -> Dict:
         return {'datetime': None, 'gps': None, 'camera_model': None}
 
 
+def load_crops(image_path: str, detections: List[Dict]) -> Tuple[List[torch.Tensor], List[Dict]]:
+    """
+    Decode an image and return preprocessed crops for its detections.
+
+    WHY: Runs in a worker thread so JPEG decode overlaps GPU inference.
+    When every crop is at least 2x the model input size, the JPEG is
+    decoded at 1/2, 1/4 or 1/8 scale (libjpeg DCT scaling via
+    Image.draft), which is several times faster and still yields crops
+    larger than CROP_INPUT_SIZE.
+
+    Args:
+        image_path: Path to original image
+        detections: Dicts with a 'bbox' key ([x1, y1, x2, y2])
+
+    Returns:
+        Tuple of (crop_tensors, detections_with_valid_crops)
+    """
+    image = Image.open(image_path)
+    orig_width, orig_height = image.size
+
+    # Pick the largest reduction that keeps the smallest crop >= model input
+    min_side = min(
+        (min(x2 - x1, y2 - y1) for x1, y1, x2, y2 in (d['bbox'] for d in detections)),
+        default=0
+    )
+    for factor in (8, 4, 2):
+        if min_side / factor >= CROP_INPUT_SIZE:
+            image.draft('RGB', (orig_width // factor, orig_height // factor))
+            break
+
+    image = image.convert('RGB')
+    image_np = np.array(image)
+
+    # bboxes are in full-resolution coordinates; scale to the decoded size
+    scale_x = image.width / orig_width
+    scale_y = image.height / orig_height
+
+    crops = []
+    kept = []
+    for detection in detections:
+        bx1, by1, bx2, by2 = detection['bbox']
+        x1, y1 = int(bx1 * scale_x), int(by1 * scale_y)
+        x2, y2 = int(bx2 * scale_x), int(by2 * scale_y)
+
+        # Crop deer region
+        crop = image_np[y1:y2, x1:x2]
+        if crop.size == 0:
+            continue
+
+        crops.append(preprocess_transform(Image.fromarray(crop)))
+        kept.append(detection)
+
+    return crops, kept
+
+
+def iter_decoded(
+    pool: ThreadPoolExecutor,
+    items: Iterable[Tuple[str, List[Dict]]]
+) -> Iterator[Tuple[str, Future]]:
+    """
+    Submit load_crops for each image, at most DECODE_WINDOW ahead of the caller.
+
+    WHY: Submitting every image up front decodes the whole task at once, and
+    each finished future holds its crops until it is released. A window of
+    futures keeps the pool busy ahead of the GPU while host memory stays
+    bounded by DECODE_WINDOW images instead of growing with the task.
+
+    Args:
+        pool: Decode thread pool
+        items: (image_path, detections) pairs in processing order
+
+    Yields:
+        tuple: (image_path, future) in input order; the future resolves to
+               load_crops' (crops, detections) or raises its exception
+    """
+    items = iter(items)
+    window = deque()
+    for image_path, detections in items:
+        window.append((image_path, pool.submit(load_crops, image_path, detections)))
+        if len(window) >= DECODE_WINDOW:
+            break
+
+    while window:
+        # Refill before handing out the oldest so decoding stays ahead
+        next_item = next(items, None)
+        if next_item is not None:
+            window.append((next_item[0], pool.submit(load_crops, *next_item)))
+        yield window.popleft()
+
+
 def check_image_quality(image: np.ndarray) -> Tuple[bool, str]:
     """
     Perform quality checks on image.
@@ -333,9 +549,9 @@ def detect_deer(self: Task, image_paths: List[str]) -> Dict:
 
                 # Extract bounding boxes
                 boxes = []
-                for det in detections[0].boxes:
-                    x1, y1, x2, y2 = det.xyxy[0].cpu().numpy()
-                    confidence = float(det.conf[0].cpu().numpy())
+                # One device-to-host copy for all boxes: rows are [x1, y1, x2, y2, conf, cls]
+                for x1, y1, x2, y2, confidence, _ in detections[0].boxes.data.cpu().numpy():
+                    confidence = float(confidence)
 
                     # Expand box by 10% for context (as per spec)
                     w = x2 - x1
@@ -422,114 +638,103 @@ def classify_deer(self: Task, detection_data: Dict) -> Dict:
 
         results = {}
 
+        eligible = []
         for image_path, det_result in detection_data.items():
             if det_result['status'] != 'success' or not det_result['detections']:
                 results[image_path] = {'classifications': [], 'status': 'skipped'}
-                continue
-
-            try:
-                # Load original image
-                image = Image.open(image_path).convert('RGB')
-                image_np = np.array(image)
-
-                classifications = []
-                crops = []
-                bboxes = []
-
-                # Prepare crops from detections
-                for detection in det_result['detections']:
-                    bbox = detection['bbox']
-                    x1, y1, x2, y2 = map(int, bbox)
-
-                    # Crop deer region
-                    crop = image_np[y1:y2, x1:x2]
-                    if crop.size == 0:
+            else:
+                eligible.append((image_path, det_result['detections']))
+
+        # WHY: Decode and crop in a thread pool (libjpeg releases the GIL) so
+        # the next images are preprocessed while the GPU classifies this one.
+        # iter_decoded keeps only DECODE_WINDOW images decoded ahead.
+        with ThreadPoolExecutor(max_workers=DECODE_WORKERS) as pool:
+            for image_path, future in iter_decoded(pool, eligible):
+                try:
+                    crops, kept = future.result()
+                    # Drop the finished future so it stops referencing the crops
+                    del future
+                    bboxes = [detection['bbox'] for detection in kept]
+                    classifications = []
+
+                    if not crops:
+                        results[image_path] = {'classifications': [], 'status': 'no_valid_crops'}
                         continue
 
-                    crop_pil = Image.fromarray(crop)
-                    crops.append(preprocess_transform(crop_pil))
-                    bboxes.append(bbox)
-
-                if not crops:
-                    results[image_path] = {'classifications': [], 'status': 'no_valid_crops'}
-                    continue
-
-                # Batch process crops
-                num_crops = len(crops)
-                all_features = []
-                all_predictions = []
+                    # Batch process crops
+                    num_crops = len(crops)
+                    all_features = []
+                    all_predictions = []
 
-                for i in range(0, num_crops, CLASSIFICATION_BATCH_SIZE):
-                    batch = torch.stack(crops[i:i + CLASSIFICATION_BATCH_SIZE]).to(DEVICE)
+                    for i in range(0, num_crops, CLASSIFICATION_BATCH_SIZE):
+                        batch = to_device(crops[i:i + CLASSIFICATION_BATCH_SIZE])
 
-                    with torch.no_grad():
-                        if MIXED_PRECISION:
-                            with torch.cuda.amp.autocast():
+                        with torch.inference_mode():
+                            with amp_autocast():
                                 outputs = model(batch)
-                        else:
-                            outputs = model(batch)
-
-                        # Get predictions and features
-                        if isinstance(outputs, tuple):
-                            logits, features = outputs
-                        else:
-                            logits = outputs
-                            features = None
-
-                        probs = F.softmax(logits, dim=1)
-                        predictions = torch.argmax(probs, dim=1)
-
-                        all_predictions.extend(predictions.cpu().numpy())
-                        if features is not None:
-                            all_features.extend(features.cpu().numpy())
-
-                # Map predictions to classes
-                class_names = ['buck', 'doe', 'fawn', 'unknown']
-                confidence_thresholds = {
-                    'buck': 0.7,
-                    'doe': 0.7,
-                    'fawn': 0.8,
-                    'unknown': 0.0
-                }
 
-                for idx, (pred, bbox) in enumerate(zip(all_predictions, bboxes)):
-                    class_name = class_names[pred]
-                    confidence = float(probs[idx][pred].cpu().numpy())
-
-                    # Apply confidence thresholding
-                    if confidence < confidence_thresholds.get(class_name, 0.7):
-                        class_name = 'unknown'
-
-                    classification = {
-                        'bbox': bbox,
-                        'class': class_name,
-                        'confidence': confidence,
-                        'probabilities': {
-                            name: float(probs[idx][i].cpu().numpy())
-                            for i, name in enumerate(class_names)
-                        }
+                            # Get predictions and features (back to FP32 for output)
+                            if isinstance(outputs, tuple):
+                                logits, features = outputs
+                                features = features.float()
+                            else:
+                                logits = outputs
+                                features = None
+
+                            probs = F.softmax(logits.float(), dim=1)
+                            predictions = torch.argmax(probs, dim=1)
+
+                            all_predictions.extend(predictions.cpu().numpy())
+                            if features is not None:
+                                all_features.extend(features.cpu().numpy())
+
+                    # Map predictions to classes
+                    class_names = ['buck', 'doe', 'fawn', 'unknown']
+                    confidence_thresholds = {
+                        'buck': 0.7,
+                        'doe': 0.7,
+                        'fawn': 0.8,
+                        'unknown': 0.0
                     }
 
-                    if all_features:
-                        classification['features'] = all_features[idx].tolist()
+                    for idx, (pred, bbox) in enumerate(zip(all_predictions, bboxes)):
+                        class_name = class_names[pred]
+                        confidence = float(probs[idx][pred].cpu().numpy())
+
+                        # Apply confidence thresholding
+                        if confidence < confidence_thresholds.get(class_name, 0.7):
+                            class_name = 'unknown'
+
+                        classification = {
+                            'bbox': bbox,
+                            'class': class_name,
+                            'confidence': confidence,
+                            'probabilities': {
+                                name: float(probs[idx][i].cpu().numpy())
+                                for i, name in enumerate(class_names)
+                            }
+                        }
 
-                    classifications.append(classification)
+                        if all_features:
+                            classification['features'] = all_features[idx].tolist()
 
-                results[image_path] = {
-                    'classifications': classifications,
-                    'status': 'success',
-                    'num_classified': len(classifications)
-                }
+                        classifications.append(classification)
 
-                logger.info(f'[OK] Classified {len(classifications)} deer in {image_path}')
+                    results[image_path] = {
+                        'classifications': classifications,
+                        'status': 'success',
+                        'num_classified': len(classifications)
+                    }
 
-            except Exception as e:
-                logger.error(f'[FAIL] Classification failed for {image_path}: {e}')
-                results[image_path] = {
-                    'classifications': [],
-                    'status': 'failed',
-                    'error': str(e)
-                }
+                    logger.info(f'[OK] Classified {len(classifications)} deer in {image_path}')
+
+                except Exception as e:
+                    logger.error(f'[FAIL] Classification failed for {image_path}: {e}')
+                    results[image_path] = {
+                        'classifications': [],
+                        'status': 'failed',
+                        'error': str(e)
+                    }
 
         return results
 
@@ -591,8 +796,10 @@ def reidentify_deer(self: Task, classification_data: Dict, database_features: Op
 
         # Convert database features to tensors if provided
         if database_features and len(database_features) > 0:
-            db_feature_vectors = np.array([d['features'] for d in database_features])
-            db_feature_vectors = torch.from_numpy(db_feature_vectors).float().to(DEVICE)
+            # Build the (N, D) matrix once, directly as contiguous float32
+            # (no float64 intermediate and second conversion pass)
+            db_feature_vectors = np.asarray([d['features'] for d in database_features], dtype=np.float32)
+            db_feature_vectors = torch.from_numpy(db_feature_vectors).to(DEVICE)
             # L2 normalize
             db_feature_vectors = F.normalize(db_feature_vectors, p=2, dim=1)
         else:
@@ -600,78 +807,116 @@ def reidentify_deer(self: Task, classification_data: Dict, database_features: Op
 
         results = {}
 
+        # Stage 1+2: decode images and extract features for their crops
+        # WHY: Batching crops across images (not per image) fills each forward
+        # pass up to REID_BATCH_SIZE instead of running one small batch per image.
+        # Decoding runs in a thread pool (libjpeg releases the GIL) so the next
+        # images are decoded while the GPU works on the current batch.
+        # At most DECODE_WINDOW images are decoded ahead (iter_decoded), and
+        # only crops not yet embedded are queued, so host memory is bounded
+        # by the window plus one batch rather than by the task size.
+        crop_queue = []
+        num_crops = 0
+        all_features = []
+        pending = []  # (image_path, classifications, start, end) into all_features
+
+        def run_batches(flush: bool = False):
+            """Run forward passes on queued crops (full batches unless flush)."""
+            while len(crop_queue) >= (1 if flush else REID_BATCH_SIZE):
+                batch = to_device(crop_queue[:REID_BATCH_SIZE])
+                del crop_queue[:REID_BATCH_SIZE]
+
+                with torch.inference_mode():
+                    with amp_autocast():
+                        features = model(batch)
+
+                    # L2 normalize features (FP32 so stored embeddings stay FP32)
+                    features = F.normalize(features.float(), p=2, dim=1)
+                    all_features.append(features)
+
+        eligible = []
         for image_path, class_result in classification_data.items():
             if class_result['status'] != 'success' or not class_result['classifications']:
                 results[image_path] = {'re_identifications': [], 'status': 'skipped'}
-                continue
-
-            try:
-                # Load original image
-                image = Image.open(image_path).convert('RGB')
-                image_np = np.array(image)
-
-                re_ids = []
-                crops = []
-                classifications = []
-
-                # Prepare crops from classifications
-                for classification in class_result['classifications']:
-                    bbox = classification['bbox']
-                    x1, y1, x2, y2 = map(int, bbox)
+            else:
+                eligible.append((image_path, class_result['classifications']))
+
+        try:
+            with ThreadPoolExecutor(max_workers=DECODE_WORKERS) as pool:
+                for image_path, future in iter_decoded(pool, eligible):
+                    try:
+                        crops, classifications = future.result()
+                    except Exception as e:
+                        logger.error(f'[FAIL] Re-identification failed for {image_path}: {e}')
+                        results[image_path] = {
+                            're_identifications': [],
+                            'status': 'failed',
+                            'error': str(e)
+                        }
+                        continue
+                    # Drop the finished future so it stops referencing the crops
+                    del future
 
-                    # Crop deer region
-                    crop = image_np[y1:y2, x1:x2]
-                    if crop.size == 0:
+                    if not crops:
+                        results[image_path] = {'re_identifications': [], 'status': 'no_valid_crops'}
                         continue
 
-                    crop_pil = Image.fromarray(crop)
-                    crops.append(preprocess_transform(crop_pil))
-                    classifications.append(classification)
+                    start = num_crops
+                    num_crops += len(crops)
+                    crop_queue.extend(crops)
+                    pending.append((image_path, classifications, start, num_crops))
 
-                if not crops:
-                    results[image_path] = {'re_identifications': [], 'status': 'no_valid_crops'}
-                    continue
+                    run_batches()
+
+            run_batches(flush=True)
 
-                # Extract features in batches
-                all_features = []
+            if not pending:
+                return results
 
-                for i in range(0, len(crops), REID_BATCH_SIZE):
-                    batch = torch.stack(crops[i:i + REID_BATCH_SIZE]).to(DEVICE)
+            all_features = torch.cat(all_features, dim=0)
 
-                    with torch.no_grad():
-                        if MIXED_PRECISION:
-                            with torch.cuda.amp.autocast():
-                                features = model(batch)
-                        else:
-                            features = model(batch)
+        except Exception as e:
+            logger.error(f'[FAIL] Re-identification feature extraction failed: {e}')
+            for image_path, _ in eligible:
+                if image_path in results:
+                    continue
+                results[image_path] = {
+                    're_identifications': [],
+                    'status': 'failed',
+                    'error': str(e)
+                }
+            return results
+
+        # Cosine similarity of every crop against every known deer in one GEMM
+        # (features are L2 normalized), then a single device -> host copy
+        # WHY: Replaces one matrix-vector product and GPU sync per crop
+        if db_feature_vectors is not None and len(db_feature_vectors) > 0:
+            best_scores, best_indices = torch.mm(all_features, db_feature_vectors.t()).max(dim=1)
+            best_scores = best_scores.cpu().numpy()
+            best_indices = best_indices.cpu().numpy()
+        else:
+            best_scores = best_indices = None
 
-                        # L2 normalize features
-                        features = F.normalize(features, p=2, dim=1)
-                        all_features.append(features)
+        all_features_np = all_features.cpu().numpy()
 
-                all_features = torch.cat(all_features, dim=0)
+        # Stage 3: match each image's crops against the database
+        for image_path, classifications, start, end in pending:
+            try:
+                re_ids = []
 
-                # Match against database
-                for idx, (features, classification) in enumerate(zip(all_features, classifications)):
-                    features_np = features.cpu().numpy()
+                for idx, classification in zip(range(start, end), classifications):
+                    features_np = all_features_np[idx]
 
                     deer_id = None
                     match_confidence = 0.0
                     is_new_deer = True
 
-                    if db_feature_vectors is not None and len(db_feature_vectors) > 0:
-                        # Compute cosine similarities
-                        similarities = torch.mm(
-                            features.unsqueeze(0),
-                            db_feature_vectors.t()
-                        ).squeeze(0)
-
-                        best_match_idx = torch.argmax(similarities).item()
-                        best_score = float(similarities[best_match_idx].cpu().numpy())
+                    if best_scores is not None:
+                        best_score = float(best_scores[idx])
 
                         # Check if match exceeds threshold
                         if best_score > REID_THRESHOLD:
-                            deer_id = database_features[best_match_idx]['deer_id']
+                            deer_id = database_features[int(best_indices[idx])]['deer_id']
                             match_confidence = best_score
                             is_new_deer = False
 
@@ -0,0 +1,43 @@
+"""
+EXIF timestamp extraction tests for scripts/ingest_images.py.
+
+PNG files are not parseable by piexif, so these cover the Pillow path.
+"""
+
+import os
+import sys
+from datetime import datetime
+
+import piexif
+from PIL import Image
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'src'))
+sys.path.insert(0, os.path.join(ROOT, 'scripts'))
+
+from ingest_images import extract_exif_data  # noqa: E402
+
+
+def test_png_with_exif_uses_exif_timestamp(tmp_path):
+    path = str(tmp_path / 'with_exif.png')
+    exif = piexif.dump({'Exif': {piexif.ExifIFD.DateTimeOriginal: b'2024:01:15 14:30:45'}})
+    Image.new('RGB', (8, 8)).save(path, exif=exif)
+
+    assert extract_exif_data(path) == (datetime(2024, 1, 15, 14, 30, 45), None)
+
+
+def test_png_without_exif_falls_back_to_mtime(tmp_path):
+    path = str(tmp_path / 'no_exif.png')
+    Image.new('RGB', (8, 8)).save(path)
+
+    expected = datetime.fromtimestamp(os.path.getmtime(path))
+    assert extract_exif_data(path) == (expected, None)
+
+
+def test_jpeg_exif_found_when_later_segment_is_truncated(tmp_path):
+    # A 200 KB ICC profile runs past EXIF_HEADER_BYTES after the Exif APP1
+    path = str(tmp_path / 'large_icc.jpg')
+    exif = piexif.dump({'Exif': {piexif.ExifIFD.DateTimeOriginal: b'2024:01:15 14:30:45'}})
+    Image.new('RGB', (8, 8)).save(path, exif=exif, icc_profile=os.urandom(200 * 1024))
+
+    assert extract_exif_data(path) == (datetime(2024, 1, 15, 14, 30, 45), None)